@@ -1,13 +1,44 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
 
 from .models import Attachment, Complaint, StaffComment
 
 
+class EstimatedCountPaginator(Paginator):
+    """Paginator that estimates the unfiltered total from planner statistics.
+
+    The changelist's exact SELECT COUNT(*) scans the whole table on every
+    page load. For an unfiltered listing on Postgres, pg_class.reltuples is
+    accurate enough for page links and costs a constant-time catalog read.
+    Filtered querysets and other backends keep the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connection.vendor == "postgresql" and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed.
+            if row is not None and row[0] >= 0:
+                return row[0]
+        return super().count
+
+
 class AttachmentInline(admin.TabularInline):
     model = Attachment
     extra = 0
     readonly_fields = ("uploaded_at", "original_filename")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("complaint")
+
 
 @admin.register(Complaint)
 class ComplaintAdmin(admin.ModelAdmin):
@@ -22,14 +53,22 @@ class ComplaintAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("status", "category", "urgency", "created_at")
-    search_fields = ("reference_id", "title", "user__username", "location")
+    list_per_page = 50
+    list_select_related = ("user", "assigned_to")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    search_fields = ("=reference_id", "^title", "=user__username", "^location")
     readonly_fields = ("reference_id", "created_at", "updated_at", "last_status_updated_at")
     inlines = [AttachmentInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("user", "assigned_to")
+
 
 @admin.register(Attachment)
 class AttachmentAdmin(admin.ModelAdmin):
     list_display = ("id", "complaint", "original_filename", "uploaded_at")
+    list_select_related = ("complaint",)
     search_fields = ("complaint__reference_id", "original_filename")
     readonly_fields = ("uploaded_at",)
 
@@ -37,5 +76,6 @@ class AttachmentAdmin(admin.ModelAdmin):
 @admin.register(StaffComment)
 class StaffCommentAdmin(admin.ModelAdmin):
     list_display = ("id", "complaint", "staff_user", "created_at")
+    list_select_related = ("complaint", "staff_user")
     search_fields = ("complaint__reference_id", "staff_user__username", "comment")
     readonly_fields = ("created_at",)
@@ -0,0 +1,29 @@
+from django.core.cache import cache
+from django.db import transaction
+
+_VERSION_KEY = "complaints:version:{user_id}"
+
+
+def get_user_version(user_id):
+    """Return the cache version stamp for a user's complaint data."""
+    return cache.get_or_set(_VERSION_KEY.format(user_id=user_id), 1, None)
+
+
+def bump_user_version(user_id):
+    """Invalidate cached pages for a user by advancing their version stamp.
+
+    The bump is deferred to transaction commit: callers run inside atomic
+    blocks, and advancing the stamp before the write is visible would let a
+    concurrent request cache stale data under the new version. Outside a
+    transaction it runs immediately. Old entries are never touched; they
+    simply stop being read and expire via their own timeouts.
+    """
+    key = _VERSION_KEY.format(user_id=user_id)
+
+    def _incr():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    transaction.on_commit(_incr)
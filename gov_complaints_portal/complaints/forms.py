@@ -1,5 +1,3 @@
-from pathlib import Path
-
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
@@ -9,12 +7,20 @@ from .models import Complaint, StaffComment
 
 User = get_user_model()
 
-ALLOWED_ATTACHMENT_EXTENSIONS = {".jpg", ".jpeg", ".png", ".pdf"}
+ALLOWED_ATTACHMENT_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".pdf"})
 MAX_ATTACHMENT_SIZE_BYTES = 5 * 1024 * 1024
 
+_ALLOWED_STATUS_TRANSITIONS = {
+    Complaint.Status.RECEIVED: frozenset({Complaint.Status.RECEIVED, Complaint.Status.IN_PROGRESS}),
+    Complaint.Status.IN_PROGRESS: frozenset({Complaint.Status.IN_PROGRESS, Complaint.Status.RESOLVED}),
+    Complaint.Status.RESOLVED: frozenset({Complaint.Status.RESOLVED}),
+}
+
 
 def validate_attachment(file_obj):
-    extension = Path(file_obj.name).suffix.lower()
+    name = file_obj.name
+    dot = name.rfind(".")
+    extension = name[dot:].lower() if dot > 0 else ""
     if extension not in ALLOWED_ATTACHMENT_EXTENSIONS:
         raise ValidationError("Only JPG, JPEG, PNG, and PDF files are allowed.")
     if file_obj.size > MAX_ATTACHMENT_SIZE_BYTES:
@@ -28,17 +34,34 @@ class MultipleFileInput(forms.ClearableFileInput):
 class MultipleFileField(forms.FileField):
     widget = MultipleFileInput
 
+    def __init__(self, *args, fail_fast=False, **kwargs):
+        # fail_fast aborts on the first invalid file instead of validating
+        # the rest of the batch. Default off so forms keep reporting every
+        # bad file at once.
+        self.fail_fast = fail_fast
+        super().__init__(*args, **kwargs)
+
     def clean(self, data, initial=None):
         if not data:
             return []
         if not isinstance(data, (list, tuple)):
             data = [data]
+        # Run the base FileField pipeline (to_python / validate / validators)
+        # directly instead of dispatching through super().clean() per file.
+        to_python = self.to_python
+        validate = self.validate
+        run_validators = self.run_validators
         cleaned_files = []
         errors = []
         for file_obj in data:
             try:
-                cleaned_files.append(super().clean(file_obj, initial))
+                value = to_python(file_obj)
+                validate(value)
+                run_validators(value)
+                cleaned_files.append(value)
             except ValidationError as error:
+                if self.fail_fast:
+                    raise
                 errors.extend(error.error_list)
         if errors:
             raise ValidationError(errors)
@@ -109,7 +132,11 @@ class StaffComplaintUpdateForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.current_status = kwargs.pop("current_status", None)
         super().__init__(*args, **kwargs)
-        self.fields["assigned_to"].queryset = User.objects.filter(is_staff=True)
+        self.fields["assigned_to"].queryset = (
+            User.objects.filter(is_staff=True)
+            .only("pk", "username", "is_staff")
+            .order_by("username")
+        )
         self.fields["assigned_to"].required = False
 
     def clean_assigned_to(self):
@@ -121,12 +148,7 @@ class StaffComplaintUpdateForm(forms.ModelForm):
     def clean_status(self):
         new_status = self.cleaned_data["status"]
         current_status = self.current_status or self.instance.status
-        allowed_transitions = {
-            Complaint.Status.RECEIVED: {Complaint.Status.RECEIVED, Complaint.Status.IN_PROGRESS},
-            Complaint.Status.IN_PROGRESS: {Complaint.Status.IN_PROGRESS, Complaint.Status.RESOLVED},
-            Complaint.Status.RESOLVED: {Complaint.Status.RESOLVED},
-        }
-        if new_status not in allowed_transitions.get(current_status, {current_status}):
+        if new_status not in _ALLOWED_STATUS_TRANSITIONS.get(current_status, {current_status}):
             raise ValidationError("Invalid status transition.")
         return new_status
 
@@ -58,32 +58,68 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        for item in sample_definitions:
-            complaint, created = Complaint.objects.get_or_create(
+        existing_by_title = {
+            title: (pk, status)
+            for pk, title, status in Complaint.objects.filter(
+                user=citizen_user,
+                title__in=[item["title"] for item in sample_definitions],
+            ).values_list("pk", "title", "status")
+        }
+        existing_titles = set(existing_by_title)
+        seeded_at = timezone.now()
+        new_complaints = [
+            Complaint(
                 user=citizen_user,
                 title=item["title"],
-                defaults={
-                    "description": item["description"],
-                    "category": item["category"],
-                    "urgency": item["urgency"],
-                    "location": item["location"],
-                    "status": item["status"],
-                    "assigned_to": staff_user if item["status"] != Complaint.Status.RECEIVED else None,
-                    "last_status_updated_at": timezone.now()
-                    if item["status"] != Complaint.Status.RECEIVED
-                    else None,
-                    "staff_remark": "Auto-seeded complaint for demo use.",
-                },
+                description=item["description"],
+                category=item["category"],
+                urgency=item["urgency"],
+                location=item["location"],
+                status=item["status"],
+                assigned_to=staff_user if item["status"] != Complaint.Status.RECEIVED else None,
+                last_status_updated_at=seeded_at
+                if item["status"] != Complaint.Status.RECEIVED
+                else None,
+                staff_remark="Auto-seeded complaint for demo use.",
             )
-            if created:
-                created_count += 1
-                if complaint.status != Complaint.Status.RECEIVED:
-                    StaffComment.objects.get_or_create(
-                        complaint=complaint,
-                        staff_user=staff_user,
-                        comment="Complaint has been reviewed by staff.",
-                    )
+            for item in sample_definitions
+            if item["title"] not in existing_titles
+        ]
+        created_complaints = Complaint.objects.bulk_create(new_complaints, batch_size=200)
+        created_count = len(created_complaints)
+
+        if created_complaints:
+            for complaint in created_complaints:
+                complaint.reference_id = complaint.generate_reference_id()
+            Complaint.objects.bulk_update(created_complaints, ["reference_id"], batch_size=200)
+
+        commentable_ids = [
+            pk
+            for pk, status in existing_by_title.values()
+            if status != Complaint.Status.RECEIVED
+        ]
+        commentable_ids.extend(
+            complaint.pk
+            for complaint in created_complaints
+            if complaint.status != Complaint.Status.RECEIVED
+        )
+        commented_ids = set(
+            StaffComment.objects.filter(
+                complaint_id__in=commentable_ids,
+                staff_user=staff_user,
+            ).values_list("complaint_id", flat=True)
+        )
+        StaffComment.objects.bulk_create(
+            [
+                StaffComment(
+                    complaint_id=pk,
+                    staff_user=staff_user,
+                    comment="Complaint has been reviewed by staff.",
+                )
+                for pk in commentable_ids
+                if pk not in commented_ids
+            ]
+        )
 
         self.stdout.write(self.style.SUCCESS("Seed complete."))
         self.stdout.write(
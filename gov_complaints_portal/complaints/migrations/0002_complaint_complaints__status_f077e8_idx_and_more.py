@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-27 03:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('complaints', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', '-created_at'], name='complaints__status_f077e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['category', 'status'], name='complaints__categor_a116b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['user', '-created_at'], name='complaints__user_id_366974_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['assigned_to', 'status'], name='complaints__assigne_2cfd47_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+from ._postgres import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0002_complaint_complaints__status_f077e8_idx_and_more"),
+    ]
+
+    operations = [
+        PostgresOnlyRunSQL(
+            sql="CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # icontains/istartswith compile to predicates on UPPER(col::text), so
+        # the indexes must be built on that expression to be usable.
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS complaint_title_trgm "
+                "ON complaints_complaint USING gin (UPPER(title::text) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS complaint_title_trgm;",
+        ),
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS complaint_location_trgm "
+                "ON complaints_complaint USING gin (UPPER(location::text) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS complaint_location_trgm;",
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+from ._postgres import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("complaints", "0003_complaint_trigram_search_indexes"),
+    ]
+
+    operations = [
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS auth_user_email_upper_idx "
+                "ON auth_user (UPPER(email));"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auth_user_email_upper_idx;",
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from ._postgres import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0004_auth_user_email_upper_index"),
+    ]
+
+    operations = [
+        # Matches the SearchVector("title", "reference_id", "location",
+        # config="english") annotation used by apply_complaint_filters.
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS complaint_search_vector_idx "
+                "ON complaints_complaint USING gin ("
+                "to_tsvector('english', "
+                "COALESCE(title, '') || ' ' || "
+                "COALESCE(reference_id, '') || ' ' || "
+                "COALESCE(location, '')));"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS complaint_search_vector_idx;",
+        ),
+    ]
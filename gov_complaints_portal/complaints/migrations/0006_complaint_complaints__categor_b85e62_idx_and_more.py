@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-27 03:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('complaints', '0005_complaint_fulltext_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['category', '-created_at'], name='complaints__categor_b85e62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(condition=models.Q(('status__in', ['received', 'in_progress'])), fields=['-created_at'], name='complaint_open_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from ._postgres import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("complaints", "0006_complaint_complaints__categor_b85e62_idx_and_more"),
+    ]
+
+    operations = [
+        # Covers HomeView's recent-complaints query: filter on user_id,
+        # order by created_at DESC, render reference_id/title/status.
+        # INCLUDE needs Postgres 11+, hence the raw vendor-gated SQL.
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS complaint_user_recent_cov "
+                "ON complaints_complaint (user_id, created_at DESC) "
+                "INCLUDE (reference_id, title, status);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS complaint_user_recent_cov;",
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+from ._postgres import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("complaints", "0007_complaint_user_recent_covering_index"),
+    ]
+
+    operations = [
+        # The admin's "=" search prefix means iexact, which compiles to
+        # UPPER(col::text) = UPPER(%s) on Postgres, so the plain unique
+        # B-trees on reference_id and username do not apply. Same idiom as
+        # the UPPER(email) index in 0004.
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS complaint_reference_id_upper_idx "
+                "ON complaints_complaint (UPPER(reference_id::text));"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS complaint_reference_id_upper_idx;",
+        ),
+        PostgresOnlyRunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS auth_user_username_upper_idx "
+                "ON auth_user (UPPER(username::text));"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auth_user_username_upper_idx;",
+        ),
+    ]
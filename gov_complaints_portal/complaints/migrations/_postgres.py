@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class PostgresOnlyRunSQL(migrations.RunSQL):
+    """RunSQL that only applies on PostgreSQL.
+
+    The production database is Postgres, but the project also runs against
+    other backends (e.g. sqlite for local testing), which cannot execute
+    Postgres-specific DDL such as GIN or covering indexes. Other backends
+    simply skip the operation.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
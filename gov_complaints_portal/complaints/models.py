@@ -1,7 +1,5 @@
-import os
-
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 
 class Complaint(models.Model):
@@ -59,6 +57,18 @@ class Complaint(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-created_at"]),
+            models.Index(fields=["category", "status"]),
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["assigned_to", "status"]),
+            models.Index(fields=["category", "-created_at"]),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status__in=["received", "in_progress"]),
+                name="complaint_open_recent_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.reference_id or f"Complaint #{self.pk}"
@@ -75,11 +85,17 @@ class Complaint(models.Model):
 
     def save(self, *args, **kwargs):
         creating = self._state.adding
-        super().save(*args, **kwargs)
-        if creating and not self.reference_id:
+        if not (creating and not self.reference_id):
+            super().save(*args, **kwargs)
+            return
+        # The reference id depends on the primary key, so it cannot be part of
+        # the INSERT itself. Keep the INSERT and the follow-up UPDATE in one
+        # transaction so a create costs a single commit instead of two.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
             reference = self.generate_reference_id()
             Complaint.objects.filter(pk=self.pk).update(reference_id=reference)
-            self.reference_id = reference
+        self.reference_id = reference
 
 
 class Attachment(models.Model):
@@ -96,11 +112,15 @@ class Attachment(models.Model):
         ordering = ["uploaded_at"]
 
     def __str__(self):
-        return self.original_filename or os.path.basename(self.file.name)
+        return self.original_filename or self.file.name.rsplit("/", maxsplit=1)[-1]
 
     def save(self, *args, **kwargs):
         if not self.original_filename and self.file:
-            self.original_filename = os.path.basename(self.file.name)
+            # Upload views set original_filename from the UploadedFile, so
+            # this fallback only runs for programmatic creation. Storage
+            # names always use forward slashes, so a plain rsplit replaces
+            # the os.path.basename parse.
+            self.original_filename = self.file.name.rsplit("/", maxsplit=1)[-1]
         super().save(*args, **kwargs)
 
 
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_user_version
+from .models import Complaint, StaffComment
+
+
+@receiver(post_save, sender=Complaint)
+@receiver(post_delete, sender=Complaint)
+def complaint_changed(sender, instance, **kwargs):
+    bump_user_version(instance.user_id)
+
+
+@receiver(post_save, sender=StaffComment)
+@receiver(post_delete, sender=StaffComment)
+def staff_comment_changed(sender, instance, **kwargs):
+    user_id = (
+        Complaint.objects.filter(pk=instance.complaint_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if user_id is not None:
+        bump_user_version(user_id)
@@ -0,0 +1,104 @@
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+_mail_queue = queue.Queue()
+_worker_lock = threading.Lock()
+_worker = None
+
+
+def _drain_queue():
+    while True:
+        job = _mail_queue.get()
+        try:
+            send_mail(**job)
+        except Exception:
+            logger.exception("Background email delivery failed.")
+        finally:
+            _mail_queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_drain_queue,
+                name="complaints-mailer",
+                daemon=True,
+            )
+            _worker.start()
+
+
+def _flush_on_exit():
+    if _worker is not None and _worker.is_alive():
+        _mail_queue.join()
+
+
+atexit.register(_flush_on_exit)
+
+
+def queue_mail(subject, message, recipient_list):
+    """Dispatch an email without blocking the request on SMTP.
+
+    When EMAIL_ASYNC is enabled the message is handed to a daemon worker
+    thread and the caller returns immediately. With the default
+    (EMAIL_ASYNC off) the send stays synchronous, which keeps the console
+    backend in development and the locmem backend in tests predictable.
+    """
+    job = {
+        "subject": subject,
+        "message": message,
+        "from_email": settings.DEFAULT_FROM_EMAIL,
+        "recipient_list": recipient_list,
+        "fail_silently": True,
+    }
+    if settings.EMAIL_ASYNC:
+        # Enqueue only once the surrounding transaction commits, so a rolled
+        # back request never emails the user. Outside a transaction the hook
+        # runs immediately.
+        def enqueue():
+            _ensure_worker()
+            _mail_queue.put(job)
+
+        transaction.on_commit(enqueue)
+    else:
+        send_mail(**job)
+
+
+def send_submission_email(complaint):
+    if not complaint.user.email:
+        return
+    queue_mail(
+        subject=f"Complaint Submitted: {complaint.reference_id}",
+        message=(
+            f"Dear {complaint.user.username},\n\n"
+            f"Your complaint has been submitted successfully.\n"
+            f"Reference ID: {complaint.reference_id}\n"
+            f"Status: {complaint.get_status_display()}\n\n"
+            "We will notify you when there is an update."
+        ),
+        recipient_list=[complaint.user.email],
+    )
+
+
+def send_status_change_email(complaint, old_status, new_status):
+    if not complaint.user.email:
+        return
+    queue_mail(
+        subject=f"Complaint Status Updated: {complaint.reference_id}",
+        message=(
+            f"Dear {complaint.user.username},\n\n"
+            f"Your complaint {complaint.reference_id} status changed from "
+            f"{old_status.replace('_', ' ').title()} to {new_status.replace('_', ' ').title()}.\n\n"
+            "Thank you."
+        ),
+        recipient_list=[complaint.user.email],
+    )
@@ -12,30 +12,37 @@ from .models import Attachment, Complaint, StaffComment
 User = get_user_model()
 
 
-@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    # PBKDF2 is deliberately slow; hashing three passwords per test dominated
+    # suite runtime. MD5 is fine for fixtures.
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+)
 class ComplaintPortalTests(TestCase):
-    def setUp(self):
-        self.media_root = tempfile.mkdtemp()
-        self.media_override = override_settings(MEDIA_ROOT=self.media_root)
-        self.media_override.enable()
-
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="citizen",
             email="citizen@example.com",
             password="StrongPass123!",
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username="othercitizen",
             email="other@example.com",
             password="StrongPass123!",
         )
-        self.staff = User.objects.create_user(
+        cls.staff = User.objects.create_user(
             username="staffmod",
             email="staff@example.com",
             password="StrongPass123!",
             is_staff=True,
         )
 
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_override.enable()
+
     def tearDown(self):
         self.media_override.disable()
         shutil.rmtree(self.media_root, ignore_errors=True)
@@ -125,6 +132,26 @@ class ComplaintPortalTests(TestCase):
         self.assertTrue(StaffComment.objects.filter(complaint=complaint).exists())
         self.assertEqual(len(mail.outbox), 1)
 
+    def test_detail_etag_does_not_swallow_pending_messages(self):
+        complaint = self.create_complaint()
+        self.client.login(username="staffmod", password="StrongPass123!")
+        detail_url = reverse("complaints:complaint_detail", kwargs={"reference_id": complaint.reference_id})
+
+        etag = self.client.get(detail_url)["ETag"]
+        revalidated = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(revalidated.status_code, 304)
+
+        # A rejected transition redirects back without touching the row, so
+        # the ETag still matches; the queued error must render, not a 304.
+        response = self.client.post(
+            reverse("complaints:staff_update_status", kwargs={"reference_id": complaint.reference_id}),
+            data={"status": Complaint.Status.RESOLVED, "staff_remark": "", "comment": ""},
+        )
+        self.assertEqual(response.status_code, 302)
+        with_message = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(with_message.status_code, 200)
+        self.assertContains(with_message, "Invalid status transition.")
+
     def test_non_staff_denied_staff_dashboard(self):
         self.client.login(username="citizen", password="StrongPass123!")
         response = self.client.get(reverse("complaints:staff_dashboard"))
@@ -132,12 +159,20 @@ class ComplaintPortalTests(TestCase):
 
     def test_search_filter_and_pagination(self):
         self.client.login(username="citizen", password="StrongPass123!")
-        for index in range(12):
-            self.create_complaint(
+        complaints = Complaint.objects.bulk_create(
+            Complaint(
                 title=f"Complaint {index}",
+                description="Street light has been non-functional for 3 days.",
                 category=Complaint.Category.SANITATION,
                 urgency=Complaint.Urgency.HIGH if index % 2 == 0 else Complaint.Urgency.LOW,
+                location="Ward 7",
+                user=self.user,
             )
+            for index in range(12)
+        )
+        for complaint in complaints:
+            complaint.reference_id = complaint.generate_reference_id()
+        Complaint.objects.bulk_update(complaints, ["reference_id"])
         response = self.client.get(
             reverse("complaints:complaint_list"),
             data={"category": Complaint.Category.SANITATION},
@@ -1,18 +1,27 @@
-from datetime import datetime
+import posixpath
+import re
+from datetime import date
+from itertools import chain
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.core.mail import send_mail
-from django.db.models import Q
-from django.http import FileResponse, Http404
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import Count, Prefetch, Q
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from django.utils.http import content_disposition_header
 from django.views import View
 from django.views.generic import CreateView, ListView, TemplateView
 
+from .cache import bump_user_version, get_user_version
 from .forms import (
     ComplaintForm,
     MultipleAttachmentForm,
@@ -21,85 +30,93 @@ from .forms import (
     StaffComplaintUpdateForm,
 )
 from .models import Attachment, Complaint, StaffComment
+from .tasks import send_status_change_email, send_submission_email
 
+# TextChoices rebuilds the .choices list on every access; these are constants,
+# so hoist them once at import time for the filter dropdowns.
+CATEGORY_CHOICES = Complaint.Category.choices
+STATUS_CHOICES = Complaint.Status.choices
+URGENCY_CHOICES = Complaint.Urgency.choices
+
+FILTER_PARAM_NAMES = ("q", "category", "status", "urgency", "start_date", "end_date")
+
+# Matches the GOV-CMP-YYYY-NNNNNN format produced by generate_reference_id.
+_REFERENCE_ID_RE = re.compile(r"^GOV-CMP-\d{4}-\d{6}$", re.IGNORECASE)
+
+
+def _extract_filter_params(params):
+    return {name: params.get(name, "").strip() for name in FILTER_PARAM_NAMES}
 
-def apply_complaint_filters(queryset, params):
-    query = params.get("q", "").strip()
-    category = params.get("category", "").strip()
-    status = params.get("status", "").strip()
-    urgency = params.get("urgency", "").strip()
-    start_date = params.get("start_date", "").strip()
-    end_date = params.get("end_date", "").strip()
 
+def apply_complaint_filters(queryset, params):
+    """Apply the list-page filters and return (queryset, filters).
+
+    The parsed values come back alongside the queryset so callers can feed
+    the template context without walking request.GET a second time.
+    """
+    filters = _extract_filter_params(params)
+    query = filters["q"]
+    category = filters["category"]
+    status = filters["status"]
+    urgency = filters["urgency"]
+    start_date = filters["start_date"]
+    end_date = filters["end_date"]
+
+    # Accumulate everything into one Q and call .filter() once at the end:
+    # each .filter() clones the queryset, so chaining six of them allocates
+    # five intermediate QuerySets for identical SQL.
+    conditions = Q()
     if query:
-        queryset = queryset.filter(
-            Q(title__icontains=query)
-            | Q(reference_id__icontains=query)
-            | Q(location__icontains=query)
-        )
+        if _REFERENCE_ID_RE.match(query):
+            # A pasted reference id is the common search; resolve it with an
+            # equality probe on the unique index instead of the search path.
+            conditions &= Q(reference_id=query.upper())
+        elif connection.vendor == "postgresql":
+            # Backed by the expression GIN index from migration 0005; keyword
+            # search becomes an index probe instead of three LIKE scans.
+            queryset = queryset.annotate(
+                search=SearchVector("title", "reference_id", "location", config="english")
+            )
+            conditions &= Q(search=SearchQuery(query, config="english"))
+        else:
+            conditions &= (
+                Q(title__icontains=query)
+                | Q(reference_id__icontains=query)
+                | Q(location__icontains=query)
+            )
     if category:
-        queryset = queryset.filter(category=category)
+        conditions &= Q(category=category)
     if status:
-        queryset = queryset.filter(status=status)
+        conditions &= Q(status=status)
     if urgency:
-        queryset = queryset.filter(urgency=urgency)
+        conditions &= Q(urgency=urgency)
 
     if start_date:
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-            queryset = queryset.filter(created_at__date__gte=start_dt)
+            conditions &= Q(created_at__date__gte=date.fromisoformat(start_date))
         except ValueError:
             pass
     if end_date:
         try:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-            queryset = queryset.filter(created_at__date__lte=end_dt)
+            conditions &= Q(created_at__date__lte=date.fromisoformat(end_date))
         except ValueError:
             pass
-    return queryset
+    if conditions:
+        queryset = queryset.filter(conditions)
+    return queryset, filters
 
 
 def store_attachments(complaint, files):
-    for file_obj in files:
-        Attachment.objects.create(
-            complaint=complaint,
-            file=file_obj,
-            original_filename=file_obj.name,
-        )
-
-
-def send_submission_email(complaint):
-    if not complaint.user.email:
-        return
-    send_mail(
-        subject=f"Complaint Submitted: {complaint.reference_id}",
-        message=(
-            f"Dear {complaint.user.username},\n\n"
-            f"Your complaint has been submitted successfully.\n"
-            f"Reference ID: {complaint.reference_id}\n"
-            f"Status: {complaint.get_status_display()}\n\n"
-            "We will notify you when there is an update."
-        ),
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[complaint.user.email],
-        fail_silently=True,
-    )
-
-
-def send_status_change_email(complaint, old_status, new_status):
-    if not complaint.user.email:
-        return
-    send_mail(
-        subject=f"Complaint Status Updated: {complaint.reference_id}",
-        message=(
-            f"Dear {complaint.user.username},\n\n"
-            f"Your complaint {complaint.reference_id} status changed from "
-            f"{old_status.replace('_', ' ').title()} to {new_status.replace('_', ' ').title()}.\n\n"
-            "Thank you."
-        ),
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[complaint.user.email],
-        fail_silently=True,
+    Attachment.objects.bulk_create(
+        [
+            Attachment(
+                complaint=complaint,
+                file=file_obj,
+                original_filename=file_obj.name,
+            )
+            for file_obj in files
+        ],
+        batch_size=100,
     )
 
 
@@ -119,7 +136,22 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         if self.request.user.is_authenticated:
-            context["recent_complaints"] = Complaint.objects.filter(user=self.request.user)[:5]
+            user_id = self.request.user.id
+            # Keyed on a per-user version stamp that the complaint/comment
+            # signals (and the staff update view) bump, so steady-state home
+            # hits are a cache read and invalidation is immediate.
+            context["recent_complaints"] = cache.get_or_set(
+                f"complaints:home:{user_id}:v{get_user_version(user_id)}",
+                # Narrow projection served by the covering index from
+                # migration 0007 on Postgres; the home page renders only
+                # these four fields.
+                lambda: list(
+                    Complaint.objects.filter(user_id=user_id).only(
+                        "reference_id", "title", "status", "created_at"
+                    )[:5]
+                ),
+                60,
+            )
         else:
             context["recent_complaints"] = []
         return context
@@ -151,25 +183,34 @@ class ComplaintListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Complaint.objects.select_related("user", "assigned_to")
+        queryset = (
+            Complaint.objects.select_related("user", "assigned_to")
+            .only(
+                "reference_id",
+                "title",
+                "status",
+                "urgency",
+                "category",
+                "created_at",
+                "user__username",
+                "assigned_to__username",
+            )
+            .annotate(
+                attachment_count=Count("attachments", distinct=True),
+                comment_count=Count("staff_comments", distinct=True),
+            )
+        )
         if not self.request.user.is_staff:
             queryset = queryset.filter(user=self.request.user)
-        queryset = apply_complaint_filters(queryset, self.request.GET)
+        queryset, self.filters = apply_complaint_filters(queryset, self.request.GET)
         return queryset.order_by("-created_at")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["categories"] = Complaint.Category.choices
-        context["statuses"] = Complaint.Status.choices
-        context["urgency_choices"] = Complaint.Urgency.choices
-        context["filters"] = {
-            "q": self.request.GET.get("q", ""),
-            "category": self.request.GET.get("category", ""),
-            "status": self.request.GET.get("status", ""),
-            "urgency": self.request.GET.get("urgency", ""),
-            "start_date": self.request.GET.get("start_date", ""),
-            "end_date": self.request.GET.get("end_date", ""),
-        }
+        context["categories"] = CATEGORY_CHOICES
+        context["statuses"] = STATUS_CHOICES
+        context["urgency_choices"] = URGENCY_CHOICES
+        context["filters"] = self.filters
         return context
 
 
@@ -187,10 +228,11 @@ class ComplaintCreateView(LoginRequiredMixin, View):
         form = ComplaintForm(request.POST)
         attachment_form = MultipleAttachmentForm(request.POST, request.FILES)
         if form.is_valid() and attachment_form.is_valid():
-            complaint = form.save(commit=False)
-            complaint.user = request.user
-            complaint.save()
-            store_attachments(complaint, attachment_form.cleaned_data["attachments"])
+            with transaction.atomic():
+                complaint = form.save(commit=False)
+                complaint.user = request.user
+                complaint.save()
+                store_attachments(complaint, attachment_form.cleaned_data["attachments"])
             send_submission_email(complaint)
             messages.success(request, f"Complaint submitted successfully. Reference: {complaint.reference_id}")
             return redirect("complaints:complaint_detail", reference_id=complaint.reference_id)
@@ -208,29 +250,55 @@ class ComplaintCreateView(LoginRequiredMixin, View):
 class ComplaintDetailView(LoginRequiredMixin, TemplateView):
     template_name = "complaints/complaint_detail.html"
 
+    def get(self, request, *args, **kwargs):
+        self.complaint = self.get_complaint()
+        # updated_at moves on every user edit and staff update, so it makes a
+        # sound validator. The lookup itself still runs (the permission check
+        # must happen before any 304 to avoid leaking reference ids), but a
+        # match skips the context build and template render entirely.
+        etag = f'"{self.complaint.updated_at.timestamp()}"'
+        # Flash messages must render even when the row is unchanged (a
+        # rejected staff update redirects here without touching it); a 304
+        # would show the stale page and leak the message onto the next one.
+        if request.headers.get("If-None-Match") == etag and not messages.get_messages(request):
+            return HttpResponseNotModified()
+        response = super().get(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
     def get_complaint(self):
-        complaint = get_object_or_404(
-            Complaint.objects.select_related("user", "assigned_to"),
-            reference_id=self.kwargs["reference_id"],
+        queryset = Complaint.objects.select_related("user", "assigned_to").prefetch_related(
+            "attachments",
+            Prefetch(
+                "staff_comments",
+                queryset=StaffComment.objects.select_related("staff_user"),
+            ),
         )
+        complaint = get_object_or_404(queryset, reference_id=self.kwargs["reference_id"])
         if not complaint.can_be_viewed_by(self.request.user):
             raise PermissionDenied("You do not have permission to view this complaint.")
         return complaint
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        complaint = self.get_complaint()
+        complaint = self.complaint
         context["complaint"] = complaint
         context["attachments"] = complaint.attachments.all()
-        context["can_edit"] = complaint.can_be_modified_by_user(self.request.user)
-        context["can_delete"] = complaint.can_be_modified_by_user(self.request.user)
+        can_modify = complaint.can_be_modified_by_user(self.request.user)
+        context["can_edit"] = can_modify
+        context["can_delete"] = can_modify
         if self.request.user.is_staff:
-            context["staff_update_form"] = StaffComplaintUpdateForm(
-                instance=complaint,
-                current_status=complaint.status,
+            # Form construction walks every model field and runs the staff
+            # choices query; defer it so the cost is only paid if the
+            # template actually renders the forms.
+            context["staff_update_form"] = SimpleLazyObject(
+                lambda: StaffComplaintUpdateForm(
+                    instance=complaint,
+                    current_status=complaint.status,
+                )
             )
-            context["staff_comment_form"] = StaffCommentForm()
-            context["staff_comments"] = complaint.staff_comments.select_related("staff_user")
+            context["staff_comment_form"] = SimpleLazyObject(StaffCommentForm)
+            context["staff_comments"] = complaint.staff_comments.all()
         return context
 
 
@@ -260,8 +328,9 @@ class ComplaintUpdateView(LoginRequiredMixin, View):
         attachment_form = MultipleAttachmentForm(request.POST, request.FILES)
 
         if form.is_valid() and attachment_form.is_valid():
-            form.save()
-            store_attachments(complaint, attachment_form.cleaned_data["attachments"])
+            with transaction.atomic():
+                form.save()
+                store_attachments(complaint, attachment_form.cleaned_data["attachments"])
             messages.success(request, "Complaint updated successfully.")
             return redirect("complaints:complaint_detail", reference_id=complaint.reference_id)
 
@@ -293,9 +362,15 @@ class ComplaintDeleteView(LoginRequiredMixin, View):
 
     def post(self, request, reference_id):
         complaint = self.get_complaint(request, reference_id)
-        for attachment in complaint.attachments.all():
-            attachment.file.delete(save=False)
+        file_names = list(complaint.attachments.values_list("file", flat=True))
         complaint.delete()
+        # Remove stored files only after the row delete succeeds: a storage
+        # failure then leaves at worst an orphaned file, never an attachment
+        # row pointing at nothing. values_list avoids hydrating Attachment
+        # instances just to read their file names.
+        for name in file_names:
+            if name:
+                default_storage.delete(name)
         messages.success(request, "Complaint deleted successfully.")
         return redirect("complaints:complaint_list")
 
@@ -307,23 +382,32 @@ class StaffDashboardView(StaffRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Complaint.objects.select_related("user", "assigned_to")
-        queryset = apply_complaint_filters(queryset, self.request.GET)
+        queryset = (
+            Complaint.objects.select_related("user", "assigned_to")
+            .only(
+                "reference_id",
+                "title",
+                "status",
+                "urgency",
+                "category",
+                "created_at",
+                "user__username",
+                "assigned_to__username",
+            )
+            .annotate(
+                attachment_count=Count("attachments", distinct=True),
+                comment_count=Count("staff_comments", distinct=True),
+            )
+        )
+        queryset, self.filters = apply_complaint_filters(queryset, self.request.GET)
         return queryset.order_by("-created_at")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["categories"] = Complaint.Category.choices
-        context["statuses"] = Complaint.Status.choices
-        context["urgency_choices"] = Complaint.Urgency.choices
-        context["filters"] = {
-            "q": self.request.GET.get("q", ""),
-            "category": self.request.GET.get("category", ""),
-            "status": self.request.GET.get("status", ""),
-            "urgency": self.request.GET.get("urgency", ""),
-            "start_date": self.request.GET.get("start_date", ""),
-            "end_date": self.request.GET.get("end_date", ""),
-        }
+        context["categories"] = CATEGORY_CHOICES
+        context["statuses"] = STATUS_CHOICES
+        context["urgency_choices"] = URGENCY_CHOICES
+        context["filters"] = self.filters
         return context
 
 
@@ -341,9 +425,21 @@ class StaffComplaintUpdateView(StaffRequiredMixin, View):
 
         if update_form.is_valid() and comment_form.is_valid():
             updated_complaint = update_form.save(commit=False)
+            now = timezone.now()
+            changed_fields = {
+                "status": updated_complaint.status,
+                "assigned_to": updated_complaint.assigned_to,
+                "staff_remark": updated_complaint.staff_remark,
+                "updated_at": now,
+            }
             if updated_complaint.status != previous_status:
-                updated_complaint.last_status_updated_at = timezone.now()
-            updated_complaint.save()
+                updated_complaint.last_status_updated_at = now
+                changed_fields["last_status_updated_at"] = now
+            # update() writes only the staff-editable columns in one
+            # round-trip; a model save() would rewrite the full row. It also
+            # bypasses post_save, so bump the owner's cache version here.
+            Complaint.objects.filter(pk=updated_complaint.pk).update(**changed_fields)
+            bump_user_version(updated_complaint.user_id)
 
             comment_text = comment_form.cleaned_data.get("comment", "").strip()
             if comment_text:
@@ -361,16 +457,24 @@ class StaffComplaintUpdateView(StaffRequiredMixin, View):
                 )
             messages.success(request, "Complaint updated successfully.")
         else:
-            errors = []
-            errors.extend(update_form.errors.get("__all__", []))
-            errors.extend(comment_form.errors.get("__all__", []))
+            errors = list(
+                chain(
+                    update_form.errors.get("__all__", []),
+                    comment_form.errors.get("__all__", []),
+                )
+            )
             if not errors:
-                for field, field_errors in update_form.errors.items():
-                    errors.extend([f"{field}: {error}" for error in field_errors])
-                for field, field_errors in comment_form.errors.items():
-                    errors.extend([f"{field}: {error}" for error in field_errors])
-            for error in errors:
-                messages.error(request, error)
+                errors = [
+                    f"{field}: {error}"
+                    for field, field_errors in chain(
+                        update_form.errors.items(), comment_form.errors.items()
+                    )
+                    for error in field_errors
+                ]
+            if errors:
+                # One combined message means one write to the message
+                # storage backend instead of one per validation error.
+                messages.error(request, "\n".join(errors))
 
         return redirect("complaints:complaint_detail", reference_id=reference_id)
 
@@ -381,7 +485,7 @@ class StaffComplaintUpdateView(StaffRequiredMixin, View):
 class AttachmentDownloadView(LoginRequiredMixin, View):
     def get(self, request, attachment_id):
         attachment = get_object_or_404(
-            Attachment.objects.select_related("complaint", "complaint__user"),
+            Attachment.objects.select_related("complaint"),
             pk=attachment_id,
         )
         complaint = attachment.complaint
@@ -392,8 +496,29 @@ class AttachmentDownloadView(LoginRequiredMixin, View):
 
         inline = request.GET.get("inline") == "1"
         filename = attachment.original_filename or attachment.file.name.rsplit("/", maxsplit=1)[-1]
-        return FileResponse(
+
+        sendfile_header = settings.ATTACHMENT_SENDFILE_HEADER
+        if sendfile_header:
+            # Hand delivery to the reverse proxy: the kernel streams the file
+            # straight from disk to socket and the worker is freed immediately.
+            response = HttpResponse()
+            response[sendfile_header] = posixpath.join(
+                settings.ATTACHMENT_SENDFILE_PREFIX, attachment.file.name
+            )
+            response["Content-Disposition"] = content_disposition_header(
+                as_attachment=not inline, filename=filename
+            )
+            response["Content-Type"] = ""
+            return response
+
+        response = FileResponse(
             attachment.file.open("rb"),
             as_attachment=not inline,
             filename=filename,
         )
+        # Read in 512KB chunks instead of the small default, and state the
+        # length up front so clients show progress and the connection can be
+        # reused; file_to_stream discovery does not work for remote storages.
+        response.block_size = 512 * 1024
+        response["Content-Length"] = attachment.file.size
+        return response
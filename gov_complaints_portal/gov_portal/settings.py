@@ -61,9 +61,14 @@ WSGI_APPLICATION = "gov_portal.wsgi.application"
 ASGI_APPLICATION = "gov_portal.asgi.application"
 
 database_url = os.getenv("DATABASE_URL")
+conn_max_age = int(os.getenv("DB_CONN_MAX_AGE", "600"))
 if database_url:
     DATABASES = {
-        "default": dj_database_url.parse(database_url, conn_max_age=600),
+        "default": dj_database_url.parse(
+            database_url,
+            conn_max_age=conn_max_age,
+            conn_health_checks=True,
+        ),
     }
 else:
     DATABASES = {
@@ -74,9 +79,31 @@ else:
             "PASSWORD": os.getenv("DB_PASSWORD", "postgres"),
             "HOST": os.getenv("DB_HOST", "127.0.0.1"),
             "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_MAX_AGE": conn_max_age,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"server_side_binding": True},
         }
     }
 
+# Set when pooling through PgBouncer in transaction mode, where server-side
+# cursors break across pooled connections.
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = env_bool(
+    "DISABLE_SERVER_SIDE_CURSORS", False
+)
+
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": redis_url,
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -96,6 +123,13 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Optional reverse-proxy delivery for attachment downloads. When set (e.g.
+# "X-Accel-Redirect" for Nginx or "X-Sendfile" for Apache), the download view
+# answers with this header instead of streaming bytes through Python, and the
+# proxy serves the file from ATTACHMENT_SENDFILE_PREFIX + the storage name.
+ATTACHMENT_SENDFILE_HEADER = os.getenv("ATTACHMENT_SENDFILE_HEADER", "")
+ATTACHMENT_SENDFILE_PREFIX = os.getenv("ATTACHMENT_SENDFILE_PREFIX", "/protected/")
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 LOGIN_REDIRECT_URL = "complaints:complaint_list"
@@ -109,6 +143,7 @@ EMAIL_HOST_USER = os.getenv("EMAIL_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
 EMAIL_USE_TLS = env_bool("EMAIL_USE_TLS", False)
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "no-reply@gov-portal.local")
+EMAIL_ASYNC = env_bool("EMAIL_ASYNC", False)
 
 if not DEBUG:
     SECURE_BROWSER_XSS_FILTER = True